@@ -12,7 +12,3 @@ def train_pipeline(data_path: str):
     X_train, X_test, y_train, y_test = clean_data(df)
     model = train_model(X_train, y_train)
     evaluate_model(model, X_test, y_test)
-
-
-if __name__ == "__main__":
-    train_pipeline(data_path=r"/data/raw/olist_customers_dataset.csv")
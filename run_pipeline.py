@@ -1,9 +1,16 @@
+import os
+
 from zenml.client import Client
 
 from pipelines.training_pipeline import train_pipeline
 
+DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "data",
+    "raw",
+    "olist_customers_dataset.csv",
+)
+
 if __name__ == "__main__":
     print(Client().active_stack.experiment_tracker.get_tracking_uri())
-    train_pipeline(
-        data_path=r"C:\Users\gotam\PycharmProjects\mlops-project\mlops_maker\data\olist_customers_dataset.csv"
-    )
+    train_pipeline(data_path=DATA_PATH)
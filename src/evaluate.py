@@ -1,9 +1,16 @@
 import logging
+import math
 from abc import ABC, abstractmethod
+from typing import Tuple
 
 import numpy as np
+from numba import njit, prange
 from sklearn.metrics import mean_squared_error, r2_score
 
+from src.utils import FASTMATH_FLAGS, log_and_reraise
+
+logger = logging.getLogger(__name__)
+
 
 class Evaluation(ABC):
     """
@@ -35,6 +42,7 @@ class MSE(Evaluation):
     to compute the MSE between true and predicted values.
     """
 
+    @log_and_reraise("Error in MSE calculation")
     def calculate_score(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
         """
         Calculate and return the Mean Squared Error (MSE) between y_true and y_pred.
@@ -46,14 +54,10 @@ class MSE(Evaluation):
         Returns:
             float: The Mean Squared Error (MSE) value.
         """
-        try:
-            logging.info("Calculating MSE")
-            mse = mean_squared_error(y_true, y_pred)
-            logging.info(f"MSE value: {mse}")
-            return mse
-        except Exception as e:
-            logging.error("Error in MSE calculation: " + str(e))
-            raise e
+        logger.info("Calculating MSE")
+        mse = mean_squared_error(y_true, y_pred)
+        logger.info("MSE value: %s", mse)
+        return mse
 
 
 class R2Score(Evaluation):
@@ -63,6 +67,7 @@ class R2Score(Evaluation):
     to compute the R2 Score between true and predicted values.
     """
 
+    @log_and_reraise("Error in R2 Score calculation")
     def calculate_score(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
         """
         Calculate and return the R2 Score (Coefficient of Determination) between y_true and y_pred.
@@ -74,14 +79,10 @@ class R2Score(Evaluation):
         Returns:
             float: The R2 Score value.
         """
-        try:
-            logging.info("Calculating R2 Score")
-            r2 = r2_score(y_true, y_pred)
-            logging.info(f"R2 Score value: {r2}")
-            return r2
-        except Exception as e:
-            logging.error("Error in R2 Score calculation: " + str(e))
-            raise e
+        logger.info("Calculating R2 Score")
+        r2 = r2_score(y_true, y_pred)
+        logger.info("R2 Score value: %s", r2)
+        return r2
 
 
 class RMSE(Evaluation):
@@ -91,6 +92,7 @@ class RMSE(Evaluation):
     to compute the RMSE between true and predicted values.
     """
 
+    @log_and_reraise("Error in RMSE calculation")
     def calculate_score(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
         """
         Calculate and return the Root Mean Squared Error (RMSE) between y_true and y_pred.
@@ -102,11 +104,81 @@ class RMSE(Evaluation):
         Returns:
             float: The Root Mean Squared Error (RMSE) value.
         """
-        try:
-            logging.info("Calculating RMSE")
-            rmse = np.sqrt(mean_squared_error(y_true, y_pred))
-            logging.info(f"RMSE value: {rmse}")
-            return rmse
-        except Exception as e:
-            logging.error("Error in RMSE calculation: " + str(e))
-            raise e
+        logger.info("Calculating RMSE")
+        rmse = np.sqrt(mean_squared_error(y_true, y_pred))
+        logger.info("RMSE value: %s", rmse)
+        return rmse
+
+
+@njit(parallel=True, fastmath=FASTMATH_FLAGS, cache=True)
+def _squared_error_sums(y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[float, float]:
+    """
+    JIT-compiled kernel returning the residual and total sums of squares.
+
+    Args:
+        y_true (np.ndarray): Contiguous 1-D float64 array of true target values.
+        y_pred (np.ndarray): Contiguous 1-D float64 array of predicted values,
+            of the same size as y_true.
+
+    Returns:
+        Tuple[float, float]: The residual (SSE) and total (SST) sums of squares.
+    """
+    n = y_true.size
+    total = 0.0
+    for i in prange(n):
+        total += y_true[i]
+    mean = total / n
+
+    sse = 0.0
+    sst = 0.0
+    for i in prange(n):
+        residual = y_true[i] - y_pred[i]
+        sse += residual * residual
+        deviation = y_true[i] - mean
+        sst += deviation * deviation
+    return sse, sst
+
+
+@log_and_reraise("Error in regression scores calculation")
+def calculate_regression_scores(
+        y_true: np.ndarray, y_pred: np.ndarray
+) -> Tuple[float, float, float]:
+    """
+    Calculate MSE, R2 Score and RMSE without materializing residual arrays.
+
+    Equivalent to calling MSE, R2Score and RMSE one after the other, but the
+    sums of squares are computed once by a fused Numba kernel and RMSE is
+    derived from the MSE instead of recomputing it.
+
+    Args:
+        y_true (np.ndarray): Array of true target values.
+        y_pred (np.ndarray): Array of predicted values.
+
+    Returns:
+        Tuple[float, float, float]: The MSE, R2 Score and RMSE values.
+
+    Raises:
+        ValueError: If y_true is empty or y_true and y_pred differ in size.
+    """
+    logger.info("Calculating MSE, R2 Score and RMSE")
+    y_true = np.ascontiguousarray(y_true, dtype=np.float64).ravel()
+    y_pred = np.ascontiguousarray(y_pred, dtype=np.float64).ravel()
+    # The Numba kernel does not bounds-check, so validate the sizes here
+    if y_true.size != y_pred.size:
+        raise ValueError(
+            f"y_true and y_pred have different sizes: {y_true.size} != {y_pred.size}"
+        )
+    if y_true.size == 0:
+        raise ValueError("Cannot calculate regression scores on empty arrays")
+    sse, sst = _squared_error_sums(y_true, y_pred)
+    mse = sse / y_true.size
+    rmse = math.sqrt(mse)
+    if sst == 0.0:
+        # Constant y_true: same convention as sklearn's r2_score
+        r2 = 1.0 if sse == 0.0 else 0.0
+    else:
+        r2 = 1.0 - sse / sst
+    logger.info(
+        "MSE value: %s, R2 Score value: %s, RMSE value: %s", mse, r2, rmse
+    )
+    return mse, r2, rmse
@@ -0,0 +1,34 @@
+import functools
+import logging
+
+# Numba fast-math flags without "nnan"/"ninf", so NaN or inf values still
+# propagate through the JIT kernels instead of being assumed away by LLVM.
+FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def log_and_reraise(message: str):
+    """
+    Decorator logging the given message with the traceback when the decorated
+    function raises, before re-raising the original exception.
+
+    Args:
+        message (str): The message to log on failure.
+
+    Returns:
+        The decorator to apply to the function.
+    """
+
+    def decorator(func):
+        logger = logging.getLogger(func.__module__)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                logger.exception(message)
+                raise
+
+        return wrapper
+
+    return decorator
@@ -1,5 +1,9 @@
+from typing import Final
+
 from zenml.steps import BaseParameters
 
+MODEL_NAME: Final = "LinearRegression"
+
 
 class ModelNameConfig(BaseParameters):
-    model_name: str = "LinearRegression"
+    model_name: str = MODEL_NAME
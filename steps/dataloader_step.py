@@ -1,23 +1,113 @@
+import hashlib
 import logging
+import os
+import tempfile
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 from zenml import step
 
+from src.preprocess import (
+    DATE_COLS,
+    DOWNCAST_DTYPES,
+    ID_COLS,
+    MEDIAN_FILL_COLS,
+    PREPROCESS_VERSION,
+    TEXT_COLS,
+    preprocess,
+)
+from src.utils import log_and_reraise
+
+logger = logging.getLogger(__name__)
+
+# Only the columns kept by preprocess are parsed, with their types
+# declared upfront so the reader does not have to infer them.
+SCHEMA = {
+    "payment_sequential": pa.int64(),
+    "payment_installments": pa.int64(),
+    "payment_value": pa.float64(),
+    "price": pa.float64(),
+    "freight_value": pa.float64(),
+    "product_name_lenght": pa.float64(),
+    "product_description_lenght": pa.float64(),
+    "product_photos_qty": pa.float64(),
+    "product_weight_g": pa.float64(),
+    "product_length_cm": pa.float64(),
+    "product_height_cm": pa.float64(),
+    "product_width_cm": pa.float64(),
+    "review_score": pa.int64(),
+}
+
+# Identifies the schema and preprocessing that produced a cached frame, so a
+# change to either never serves a stale cache.
+CACHE_KEY = hashlib.sha256(
+    repr(
+        (
+            PREPROCESS_VERSION,
+            SCHEMA,
+            DATE_COLS,
+            MEDIAN_FILL_COLS,
+            ID_COLS,
+            TEXT_COLS,
+            DOWNCAST_DTYPES,
+        )
+    ).encode()
+).hexdigest()[:12]
+
 
 class IngestData:
     def __init__(self, data_path: str):
         self.data_path = data_path
 
+    @log_and_reraise("Error while ingesting data")
     def get_data(self):
-        logging.info(f"Ingesting data from {self.data_path}")
-        return pd.read_csv(self.data_path)
+        logger.info("Ingesting data from %s", self.data_path)
+        table = pv.read_csv(
+            self.data_path,
+            # review messages contain quoted line breaks
+            parse_options=pv.ParseOptions(newlines_in_values=True),
+            convert_options=pv.ConvertOptions(
+                include_columns=list(SCHEMA), column_types=SCHEMA
+            ),
+        )
+        return table.to_pandas(self_destruct=True)
 
 
 @step
 def ingest_df(data_path: str) -> pd.DataFrame:
+    # The preprocessed frame is cached next to the CSV and reused as long
+    # as the CSV has not been modified since. CACHE_KEY is part of the file
+    # name, so a new schema or PREPROCESS_VERSION uses a new cache file.
+    cache_path = f"{data_path}.{CACHE_KEY}.parquet"
+    if (
+            os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= os.path.getmtime(data_path)
+    ):
+        logger.info("Loading cached data from %s", cache_path)
+        try:
+            return pd.read_parquet(cache_path, engine="pyarrow")
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("Ignoring unreadable data cache %s: %s", cache_path, e)
+
+    df = IngestData(data_path).get_data()
+    df = preprocess(df)
+    _write_cache(df, cache_path)
+    return df
+
+
+def _write_cache(df: pd.DataFrame, cache_path: str) -> None:
+    # Write to a temporary file first and atomically move it into place, so
+    # a crashed or concurrent run never leaves a truncated cache behind.
+    tmp_path = None
     try:
-        df = IngestData(data_path).get_data()
-        return df
-    except Exception as e:
-        logging.error("Error while ingesting data")
-        raise e
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(cache_path)), suffix=".tmp"
+        )
+        os.close(fd)
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Could not write data cache %s: %s", cache_path, e)
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
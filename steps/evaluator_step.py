@@ -1,14 +1,14 @@
-import logging
 from typing import Tuple
 
 import mlflow
+import numpy as np
 import pandas as pd
 from sklearn.base import RegressorMixin
 from typing_extensions import Annotated
 from zenml import step
 from zenml.client import Client
 
-from src.evaluate import MSE, R2Score, RMSE
+from src.evaluate import calculate_regression_scores
 
 experiment_tracker = Client().active_stack.experiment_tracker
 
@@ -28,28 +28,17 @@ def evaluate_model(
         r2_score: float
         rmse: float
     """
-    try:
-        prediction = model.predict(x_test)
-
-        # Using the MSE class for mean squared error calculation
-        mse_class = MSE()
-        mse = mse_class.calculate_score(y_test, prediction)
-        mlflow.log_metric("mse", mse)
-
-        # Using the R2Score class for R2 score calculation
-        r2_class = R2Score()
-        r2_score = r2_class.calculate_score(y_test, prediction)
-        mlflow.log_metric("r2_score", r2_score)
-
-        # Using the RMSE class for root mean squared error calculation
-        rmse_class = RMSE()
-        rmse = rmse_class.calculate_score(y_test, prediction)
-        mlflow.log_metric("rmse", rmse)
-
-        return mse, r2_score, rmse
-    except Exception as e:
-        logging.error(e)
-        raise e
+    # The preprocessed features are int32/float32, which float32 holds
+    # exactly, so avoid the float64 upcast of a mixed-dtype to_numpy()
+    prediction = model.predict(x_test.to_numpy(dtype=np.float32))
+
+    # Compute all metrics in a single pass over the residuals
+    mse, r2_score, rmse = calculate_regression_scores(y_test, prediction)
+    # Log all metrics in one batched call instead of one request per metric
+    metrics = {"mse": mse, "r2_score": r2_score, "rmse": rmse}
+    mlflow.log_metrics(metrics)
+
+    return mse, r2_score, rmse
 
 
 if __name__ == "__main__":
@@ -5,7 +5,9 @@ import pandas as pd
 from typing_extensions import Annotated
 from zenml import step
 
-from src.preprocess import DataPreprocessStrategy, DataCleaning, DataDivideStrategy
+from src.preprocess import split
+
+logger = logging.getLogger(__name__)
 
 
 @step
@@ -17,16 +19,7 @@ def clean_data(
     Annotated[pd.Series, "y_train"],
     Annotated[pd.Series, "y_test"],
 ]:
-    try:
-        process_strategy = DataPreprocessStrategy()
-        data_cleaning = DataCleaning(df, process_strategy)
-        processed_data = data_cleaning.handle_data()
-
-        divide_strategy = DataDivideStrategy()
-        data_cleaning = DataCleaning(processed_data, divide_strategy)
-        X_train, X_test, y_train, y_test = data_cleaning.handle_data()
-        logging.info("Data cleaning completed")
-        return X_train, X_test, y_train, y_test
-    except Exception as e:
-        logging.error(f"Error ibn cleaning data: {e}")
-        raise e
+    # ingest_df already returns preprocessed data, only split it here
+    X_train, X_test, y_train, y_test = split(df)
+    logger.info("Data splitting completed")
+    return X_train, X_test, y_train, y_test
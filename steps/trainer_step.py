@@ -1,31 +1,41 @@
-import logging
-
 import mlflow
+import numpy as np
 import pandas as pd
 from sklearn.base import RegressorMixin
 from zenml import step
 from zenml.client import Client
 
-from src.train_model import LinearRegressionModel
-from . import config
-from .config import ModelNameConfig
+from src.train_model import LinearRegressionModel, RidgeRegressionModel
+from .config import MODEL_NAME
 
 experiment_tracker = Client().active_stack.experiment_tracker
 
+MODEL_REGISTRY = {
+    "LinearRegression": LinearRegressionModel,
+    "Ridge": RidgeRegressionModel,
+}
+
 
 @step(experiment_tracker=experiment_tracker.name)
 def train_model(
         X_train: pd.DataFrame,
         y_train: pd.DataFrame,
 ) -> RegressorMixin:
-    try:
-        if ModelNameConfig().model_name == "LinearRegression":
-            mlflow.sklearn.autolog()
-            model = LinearRegressionModel()
-            trained_model = model.train(X_train, y_train)
-            return trained_model
-        else:
-            raise ValueError(f"Model {config.ModelNameConfig.model_name} not supported")
-    except Exception as e:
-        logging.error(f"Error in training model:{e}")
-        raise e
+    if MODEL_NAME not in MODEL_REGISTRY:
+        raise ValueError(f"Model {MODEL_NAME} not supported")
+    # evaluate_model scores a single target, so multi-target fits such as
+    # RidgeRegressionModel's MultiOutputRegressor path are not supported here
+    if np.ndim(y_train) > 1 and np.shape(y_train)[1] > 1:
+        raise ValueError("train_model only supports a single target column")
+    # Autolog params and metrics only: signature and input example
+    # inference scan X_train, and the model is logged once explicitly.
+    mlflow.sklearn.autolog(
+        log_models=False, log_input_examples=False, log_model_signatures=False
+    )
+    model = MODEL_REGISTRY[MODEL_NAME]()
+    trained_model = model.train(X_train, y_train)
+    # Autologging only patches sklearn estimators, so log the parameters
+    # explicitly for every registered model
+    mlflow.log_params(trained_model.get_params())
+    mlflow.sklearn.log_model(trained_model, "model")
+    return trained_model